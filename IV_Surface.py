@@ -12,10 +12,11 @@ import streamlit as st
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import timedelta
-from scipy.stats import norm
+from concurrent.futures import ThreadPoolExecutor
+from scipy.special import ndtr
 from scipy.optimize import brentq
-from scipy.interpolate import griddata
+from scipy.interpolate import LinearNDInterpolator, RBFInterpolator
+from scipy.spatial import Delaunay
 import plotly.graph_objects as go
 #end imports
 
@@ -24,53 +25,407 @@ st.title('Implied Volatility Surface')
 
 # Begin functions
 
-def bs_call_no_div(S, K, T, r, sigma):
-    N = norm.cdf
-    d1 = (np.log(S/K) + (r + sigma**2/2)*T) / (sigma*np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    call_price = S * N(d1) - K * np.exp(-r*T)* N(d2)
-    return call_price
+def bs_price(S, K, T, r, q, sigma, is_call):
+    # works on scalars or ndarrays; ndtr is the raw C normal CDF
+    sqrtT = np.sqrt(T)
+    d1 = (np.log(S/K) + (r - q + 0.5*sigma*sigma)*T) / (sigma*sqrtT)
+    d2 = d1 - sigma*sqrtT
+    disc_r = np.exp(-r*T)
+    disc_q = np.exp(-q*T)
+    call = S*disc_q*ndtr(d1) - K*disc_r*ndtr(d2)
+    put = K*disc_r*ndtr(-d2) - S*disc_q*ndtr(-d1)
+    return np.where(is_call, call, put)
+
+
+def price_and_vega(S, K, T, r, q, sigma, is_call,
+                   sqrtT=None, disc_r=None, disc_q=None):
+    # fused price + vega for the Newton loop: d1, the discount factors and
+    # sqrt(T) are computed once and shared instead of once per output;
+    # callers iterating over sigma can pass the sigma-independent pieces in
+    if sqrtT is None:
+        sqrtT = np.sqrt(T)
+    if disc_r is None:
+        disc_r = np.exp(-r*T)
+    if disc_q is None:
+        disc_q = np.exp(-q*T)
+    Sdq = S * disc_q
+    Kdr = K * disc_r
+    d1 = (np.log(S/K) + (r - q + 0.5*sigma*sigma)*T) / (sigma*sqrtT)
+    d2 = d1 - sigma*sqrtT
+    Nd1 = ndtr(d1)
+    Nd2 = ndtr(d2)
+    price = np.where(is_call,
+                     Sdq*Nd1 - Kdr*Nd2,
+                     Kdr*(1.0 - Nd2) - Sdq*(1.0 - Nd1))
+    vega = Sdq * np.exp(-0.5*d1*d1) / np.sqrt(2*np.pi) * sqrtT
+    return price, vega
+
+
+def in_arbitrage_bounds(prices, S, Ks, Ts, r, q, is_call):
+    # quotes outside the no-arbitrage bounds have no sigma in the bracket,
+    # so solvers skip them rather than burn iterations failing
+    prices = np.asarray(prices, dtype=np.float64)
+    Ks = np.asarray(Ks, dtype=np.float64)
+    Ts = np.asarray(Ts, dtype=np.float64)
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), prices.shape)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        fwd = S * np.exp(-q * Ts)
+        disc_K = Ks * np.exp(-r * Ts)
+        intrinsic = np.where(is_call,
+                             np.maximum(fwd - disc_K, 0.0),
+                             np.maximum(disc_K - fwd, 0.0))
+        upper = np.where(is_call, fwd, disc_K)
+        return ((Ts > 0) &
+                (prices > intrinsic * 1.00001) &
+                (prices < upper * 0.99999))
+
+
+def implied_volatility(price, S, K, T, r, q=0, is_call=True):
+    if T <= 0 or price <= 0:
+        return np.nan
 
-def bs_call_div(S, K, T, r, q, sigma):
-    N = norm.cdf
-    d1 = (np.log(S/K) + (r - q + sigma**2/2)*T) / (sigma*np.sqrt(T))
-    d2 = d1 - sigma* np.sqrt(T)
-    call_price = S*np.exp(-q*T) * N(d1) - K * np.exp(-r*T)* N(d2)
-    return call_price
+    def objective_function(sigma):
+        return bs_price(S, K, T, r, q, sigma, is_call) - price
 
-def bs_put_no_div(S, K, T, r, sigma):
-    N = norm.cdf
-    d1 = (np.log(S/K) + (r + sigma**2/2)*T) / (sigma*np.sqrt(T))
-    d2 = d1 - sigma* np.sqrt(T)
-    put_price = K*np.exp(-r*T)*N(-d2) - S*N(-d1)
-    return put_price
+    try:
+        implied_vol = brentq(objective_function, 1e-6, 5)
+    except (ValueError, RuntimeError):
+        implied_vol = np.nan
 
-def bs_put_div(S, K, T, r, q, sigma):
-    N = norm.cdf
-    d1 = (np.log(S/K) + (r - q + sigma**2/2)*T) / (sigma*np.sqrt(T))
-    d2 = d1 - sigma* np.sqrt(T)
-    put_price = K*np.exp(-r*T)*N(-d2) - S*np.exp(-q*T)*N(-d1)
-    return put_price
+    return implied_vol
 
 
+def implied_vol_vec(prices, S, Ks, Ts, r, q, is_call, tol=1e-8, max_iter=50):
+    # Vectorized Newton-Raphson with a bisection fallback, solving all
+    # options at once instead of one brentq call per row.
+    prices = np.asarray(prices, dtype=np.float64)
+    Ks = np.asarray(Ks, dtype=np.float64)
+    Ts = np.asarray(Ts, dtype=np.float64)
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), prices.shape)
 
+    iv = np.full(prices.shape, np.nan)
 
+    valid = in_arbitrage_bounds(prices, S, Ks, Ts, r, q, is_call)
 
-def implied_volatility(price, S, K, T, r, q=0):
-    if T <= 0 or price <= 0:
-        return np.nan
+    if not valid.any():
+        return iv
 
-    def objective_function(sigma):
-        return bs_call_price(S, K, T, r, sigma, q) - price
+    prices = prices[valid]
+    Ks = Ks[valid]
+    Ts = Ts[valid]
+    is_call = is_call[valid]
+
+    lo = np.full(prices.shape, 1e-6)
+    hi = np.full(prices.shape, 5.0)
+    converged = np.zeros(prices.shape, dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Brenner-Subrahmanyam approximation as a warm start
+        sigma = np.clip(np.sqrt(2 * np.pi / Ts) * prices / S, lo, hi)
+
+        # all strikes of an expiry share T, so take the transcendentals
+        # once per unique expiry and broadcast back per strike
+        uniq_T, inv = np.unique(Ts, return_inverse=True)
+        sqrtT = np.sqrt(uniq_T)[inv]
+        disc_r = np.exp(-r * uniq_T)[inv]
+        disc_q = np.exp(-q * uniq_T)[inv]
+
+        for _ in range(max_iter):
+            price_model, vega = price_and_vega(S, Ks, Ts, r, q, sigma, is_call,
+                                               sqrtT=sqrtT, disc_r=disc_r,
+                                               disc_q=disc_q)
+
+            resid = price_model - prices
+            converged |= np.abs(resid) < tol
+            if converged.all():
+                break
+
+            # tighten the bracket around the root (price is monotone in sigma)
+            lo = np.where(~converged & (resid < 0), sigma, lo)
+            hi = np.where(~converged & (resid > 0), sigma, hi)
 
+            newton = sigma - resid / vega
+            # bisect where vega is degenerate or the step leaves the bracket
+            fallback = (vega < 1e-8) | (newton <= lo) | (newton >= hi)
+            sigma = np.where(converged, sigma,
+                             np.where(fallback, 0.5 * (lo + hi), newton))
+
+    iv[valid] = np.where(converged, sigma, np.nan)
+    return iv
+
+
+
+
+# yfinance calls are cached by symbol/expiry so widget-only reruns
+# (e.g. moving the strike filter) never touch the network
+
+@st.cache_data(ttl=300)
+def get_expirations(symbol):
+    return yf.Ticker(symbol).options
+
+
+# show_spinner=False: this runs on executor threads that have no Streamlit
+# script run context, and the spinner is what trips the per-thread warning
+@st.cache_data(ttl=300, show_spinner=False)
+def get_chain(symbol, exp_str):
+    opt_chain = yf.Ticker(symbol).option_chain(exp_str)
+    return opt_chain.calls, opt_chain.puts
+
+
+# import and warm up the Numba kernel once per worker process; every
+# session and rerun after that gets the compiled handle back instantly
+@st.cache_resource
+def get_iv_solver():
     try:
-        implied_vol = brentq(objective_function, 1e-6, 5)
-    except (ValueError, RuntimeError):
-        implied_vol = np.nan
+        from iv_kernel import iv_batch
+    except ImportError:
+        return None
+    iv_batch(np.array([0.1]), 1.0, np.array([1.0]), np.array([0.5]),
+             0.0, 0.0, np.array([True]), np.zeros(1))
+    return iv_batch
 
-    return implied_vol
+
+# the Delaunay triangulation only depends on the (T, K) point cloud, not
+# on the IV values, so cache it and just swap the values between reruns
+@st.cache_resource
+def get_triangulation(points_bytes, n_points):
+    points = np.frombuffer(points_bytes).reshape(n_points, 2)
+    return Delaunay(points)
+
+
+@st.cache_data(ttl=300)
+def get_spot(symbol):
+    history = yf.Ticker(symbol).history(period='5d')
+    if history.empty:
+        return None
+    return float(history['Close'].iloc[-1])
 
 
+# cached end-to-end: re-entering the same parameters returns the pickled
+# figure instantly instead of re-running fetch, inversion and interpolation
+@st.cache_data(ttl=300, show_spinner='Calculating implied volatility...')
+def build_figure(symbol, r, q, option_type, y_axis_option,
+                 min_strike_pct, max_strike_pct, render_mode):
+    warnings = []
+    today = pd.Timestamp('today').normalize()
+
+    exp_idx = pd.DatetimeIndex(get_expirations(symbol))
+    exp_dates = exp_idx[exp_idx > today + pd.Timedelta(days=7)]
+
+    if exp_dates.empty:
+        raise ValueError(f'No available option expiration dates for {symbol}.')
+
+    call_frames = []
+    put_frames = []
+    fetch_failures = []
+
+    def fetch_chain(exp_date):
+        try:
+            calls, puts = get_chain(symbol, exp_date.strftime('%Y-%m-%d'))
+            return exp_date, calls, puts, None
+        except Exception as e:
+            return exp_date, None, None, e
+
+    # the expiry fetches are independent blocking HTTP calls, so fan them out
+    with ThreadPoolExecutor(max_workers=min(16, len(exp_dates))) as executor:
+        chain_results = list(executor.map(fetch_chain, exp_dates))
+
+    for exp_date, calls, puts, error in chain_results:
+        if error is not None:
+            fetch_failures.append(f'{exp_date.date()}: {error}')
+            continue
+
+        calls = calls.query('bid > 0 and ask > 0')
+        puts = puts.query('bid > 0 and ask > 0')
+
+        call_frames.append(calls.loc[:, ['strike', 'bid', 'ask']].assign(
+            mid=(calls['bid'] + calls['ask']) / 2,
+            expirationDate=exp_date
+        ))
+        put_frames.append(puts.loc[:, ['strike', 'bid', 'ask']].assign(
+            mid=(puts['bid'] + puts['ask']) / 2,
+            expirationDate=exp_date
+        ))
+
+    if fetch_failures:
+        warnings.append('Failed to fetch option chains for: ' + ', '.join(fetch_failures))
+
+    if not call_frames:
+        raise ValueError('No option data available after filtering.')
+
+    call_options_df = pd.concat(call_frames, ignore_index=True)
+    put_options_df = pd.concat(put_frames, ignore_index=True)
+
+    spot_price = get_spot(symbol)
+    if spot_price is None:
+        raise ValueError(f'Failed to retrieve spot price data for {symbol}.')
+
+    call_options_df['daysToExpiration'] = (call_options_df['expirationDate'] - today).dt.days
+    call_options_df['timeToExpiration'] = call_options_df['daysToExpiration'] / 365
+
+    put_options_df['daysToExpiration'] = (put_options_df['expirationDate'] - today).dt.days
+    put_options_df['timeToExpiration'] = put_options_df['daysToExpiration'] / 365
+
+    call_options_df = call_options_df[
+        (call_options_df['strike'] >= spot_price * (min_strike_pct / 100)) &
+        (call_options_df['strike'] <= spot_price * (max_strike_pct / 100))
+    ]
+
+    put_options_df = put_options_df[
+        (put_options_df['strike'] >= spot_price * (min_strike_pct / 100)) &
+        (put_options_df['strike'] <= spot_price * (max_strike_pct / 100))
+    ]
+
+    call_options_df.reset_index(drop=True, inplace=True)
+    put_options_df.reset_index(drop=True, inplace=True)
+
+    options_df = call_options_df if option_type == 'Call' else put_options_df
+
+    iv_solver = get_iv_solver()
+    if iv_solver is not None:
+        is_call_arr = np.full(len(options_df), option_type == 'Call')
+        iv_out = np.empty(len(options_df))
+        iv_solver(
+            np.ascontiguousarray(options_df['mid'].values, dtype=np.float64),
+            float(spot_price),
+            np.ascontiguousarray(options_df['strike'].values, dtype=np.float64),
+            np.ascontiguousarray(options_df['timeToExpiration'].values, dtype=np.float64),
+            r,
+            q,
+            is_call_arr,
+            iv_out
+        )
+        options_df['impliedVolatility'] = iv_out
+    else:
+        ivs = implied_vol_vec(
+            prices=options_df['mid'].values,
+            S=spot_price,
+            Ks=options_df['strike'].values,
+            Ts=options_df['timeToExpiration'].values,
+            r=r,
+            q=q,
+            is_call=(option_type == 'Call')
+        )
+
+        # brentq mop-up for the rare rows Newton attempted but left
+        # unconverged, iterating raw tuples rather than a pandas apply;
+        # quotes the pre-filter rejected stay NaN without a brentq call
+        failed = np.isnan(ivs) & in_arbitrage_bounds(
+            options_df['mid'].values,
+            spot_price,
+            options_df['strike'].values,
+            options_df['timeToExpiration'].values,
+            r, q, option_type == 'Call'
+        )
+        if failed.any():
+            ivs[failed] = np.fromiter(
+                (implied_volatility(mid, spot_price, strike, t, r, q,
+                                    option_type == 'Call')
+                 for mid, strike, t in options_df.loc[
+                     failed, ['mid', 'strike', 'timeToExpiration']
+                 ].itertuples(index=False, name=None)),
+                dtype=np.float64,
+                count=int(failed.sum())
+            )
+
+        options_df['impliedVolatility'] = ivs
+
+    options_df.dropna(subset=['impliedVolatility'], inplace=True)
+
+    # Yahoo chains can list one strike twice within an expiry (adjusted /
+    # non-standard contracts); duplicate points make the RBF fit singular
+    options_df = options_df.drop_duplicates(subset=['strike', 'timeToExpiration'])
+
+    options_df['impliedVolatility'] *= 100
+
+    # no sort here: the scattered-point interpolators are order-invariant
+
+    options_df['moneyness'] = options_df['strike'] / spot_price
+
+    if y_axis_option == 'Strike Price ($)':
+        Y = options_df['strike'].values
+        y_label = 'Strike Price ($)'
+    else:
+        Y = options_df['moneyness'].values
+        y_label = 'Moneyness (Strike / Spot)'
+
+    X = options_df['timeToExpiration'].values
+    Z = options_df['impliedVolatility'].values
+
+    # float32 is plenty for display and halves what Plotly serializes
+    ti = np.linspace(X.min(), X.max(), 50, dtype=np.float32)
+    ki = np.linspace(Y.min(), Y.max(), 50, dtype=np.float32)
+    T, K = np.meshgrid(ti, ki)
+
+    points = np.ascontiguousarray(np.column_stack([X, Y]))
+    Zi = None
+    if len(X) < 800:
+        # at typical chain sizes the Qhull triangulation costs more than the
+        # interpolation itself; local RBF is faster and leaves no NaN holes.
+        # Normalize both axes to unit span first: the expiry gaps in T dwarf
+        # the strike/moneyness spacing, so raw distances would draw all the
+        # neighbors from a single expiry and leave the local spline fit
+        # rank-deficient.
+        offset = points.min(axis=0)
+        span = np.ptp(points, axis=0)
+        span[span == 0] = 1.0
+        grid = np.column_stack([T.ravel(), K.ravel()])
+        try:
+            rbf = RBFInterpolator((points - offset) / span, Z,
+                                  neighbors=min(32, len(X)),
+                                  kernel='thin_plate_spline')
+            Zi = rbf((grid - offset) / span).reshape(T.shape)
+            Zi = Zi.astype(np.float32, copy=False)
+        except np.linalg.LinAlgError:
+            # degenerate point cloud; fall back to the triangulation path
+            Zi = None
+    if Zi is None:
+        tri = get_triangulation(points.tobytes(), len(points))
+        interp = LinearNDInterpolator(tri, Z)
+        Zi = interp(T, K).astype(np.float32, copy=False)
+        Zi = np.ma.array(Zi, mask=np.isnan(Zi))
+
+    if render_mode == '3D Surface':
+        fig = go.Figure(data=[go.Surface(
+            x=T, y=K, z=Zi,
+            colorscale='Viridis',
+            colorbar_title='Implied Volatility (%)'
+        )])
+
+        fig.update_layout(
+            title=f'Implied Volatility Surface for {symbol} Options',
+            scene=dict(
+                xaxis_title='Time to Expiration (years)',
+                yaxis_title=y_label,
+                zaxis_title='Implied Volatility (%)'
+            ),
+            autosize=False,
+            width=900,
+            height=800,
+            margin=dict(l=65, r=50, b=65, t=90)
+        )
+    else:
+        # 2D heatmap skips the per-vertex mesh work and ships far fewer
+        # bytes to the browser, so parameter sweeps stay snappy
+        fig = go.Figure(data=[go.Heatmap(
+            x=ti, y=ki, z=Zi,
+            colorscale='Viridis',
+            colorbar_title='Implied Volatility (%)'
+        )])
+
+        fig.update_layout(
+            title=f'Implied Volatility Surface for {symbol} Options',
+            xaxis_title='Time to Expiration (years)',
+            yaxis_title=y_label,
+            autosize=False,
+            width=900,
+            height=800,
+            margin=dict(l=65, r=50, b=65, t=90)
+        )
+
+    return fig, warnings
+
 
 # end functions
 
@@ -100,6 +455,11 @@ y_axis_option = st.sidebar.selectbox(
     ('Strike Price ($)', 'Moneyness')
 )
 
+render_mode = st.sidebar.radio(
+    'Render',
+    ('Heatmap (fast)', '3D Surface')
+)
+
 st.sidebar.header('Ticker Symbol')
 ticker_symbol = st.sidebar.text_input(
     'Enter Ticker Symbol',
@@ -131,155 +491,25 @@ if min_strike_pct >= max_strike_pct:
     st.sidebar.error('Minimum percentage must be less than maximum percentage.')
     st.stop()
 
-ticker = yf.Ticker(ticker_symbol)
-
-today = pd.Timestamp('today').normalize()
-
 try:
-    expirations = ticker.options
+    fig, fetch_warnings = build_figure(
+        ticker_symbol,
+        risk_free_rate,
+        dividend_yield,
+        option_type,
+        y_axis_option,
+        min_strike_pct,
+        max_strike_pct,
+        render_mode
+    )
+except ValueError as e:
+    st.error(str(e))
+    st.stop()
 except Exception as e:
-    st.error(f'Error fetching options for {ticker_symbol}: {e}')
+    st.error(f'Error building surface for {ticker_symbol}: {e}')
     st.stop()
 
-exp_dates = [pd.Timestamp(exp) for exp in expirations if pd.Timestamp(exp) > today + timedelta(days=7)]
-
-if not exp_dates:
-    st.error(f'No available option expiration dates for {ticker_symbol}.')
-else:
-    option_call_data = []
-    option_put_data = []
-
-    for exp_date in exp_dates:
-        try:
-            opt_chain = ticker.option_chain(exp_date.strftime('%Y-%m-%d'))
-            calls = opt_chain.calls
-            puts = opt_chain.puts
-        except Exception as e:
-            st.warning(f'Failed to fetch option chain for {exp_date.date()}: {e}')
-            continue
-
-        calls = calls[(calls['bid'] > 0) & (calls['ask'] > 0)]
-        puts = puts[(puts['bid'] > 0) & (puts['ask'] > 0)]
-
-        for index, row in calls.iterrows():
-            strike = row['strike']
-            bid = row['bid']
-            ask = row['ask']
-            mid_price = (bid + ask) / 2
-
-            option_call_data.append({
-                'expirationDate': exp_date,
-                'strike': strike,
-                'bid': bid,
-                'ask': ask,
-                'mid': mid_price
-            })
-            
-            for index, row in puts.iterrows():
-                strike = row['strike']
-                bid = row['bid']
-                ask = row['ask']
-                mid_price = (bid + ask) / 2
-
-                option_put_data.append({
-                    'expirationDate': exp_date,
-                    'strike': strike,
-                    'bid': bid,
-                    'ask': ask,
-                    'mid': mid_price
-                })
-
-    if not option_call_data:
-        st.error('No option data available after filtering.')
-    else:
-        call_options_df = pd.DataFrame(option_call_data)
-        put_options_df = pd.DataFrame(option_put_data)
-
-        try:
-            spot_history = ticker.history(period='5d')
-            if spot_history.empty:
-                st.error(f'Failed to retrieve spot price data for {ticker_symbol}.')
-                st.stop()
-            else:
-                spot_price = spot_history['Close'].iloc[-1]
-        except Exception as e:
-            st.error(f'An error occurred while fetching spot price data: {e}')
-            st.stop()
-
-        call_options_df['daysToExpiration'] = (call_options_df['expirationDate'] - today).dt.days
-        call_options_df['timeToExpiration'] = call_options_df['daysToExpiration'] / 365
-        
-        put_options_df['daysToExpiration'] = (put_options_df['expirationDate'] - today).dt.days
-        put_options_df['timeToExpiration'] = put_options_df['daysToExpiration'] / 365
-
-        call_options_df = call_options_df[
-            (call_options_df['strike'] >= spot_price * (min_strike_pct / 100)) &
-            (call_options_df['strike'] <= spot_price * (max_strike_pct / 100))
-        ]
-        
-        put_options_df = put_options_df[
-            (put_options_df['strike'] >= spot_price * (min_strike_pct / 100)) &
-            (put_options_df['strike'] <= spot_price * (max_strike_pct / 100))
-        ]
-
-        call_options_df.reset_index(drop=True, inplace=True)
-        put_options_df.reset_index(drop=True, inplace=True)
-
-        with st.spinner('Calculating implied volatility...'):
-            options_df['impliedVolatility'] = options_df.apply(
-                lambda row: implied_volatility(
-                    price=row['mid'],
-                    S=spot_price,
-                    K=row['strike'],
-                    T=row['timeToExpiration'],
-                    r=risk_free_rate,
-                    q=dividend_yield
-                ), axis=1
-            )
-
-        options_df.dropna(subset=['impliedVolatility'], inplace=True)
-
-        options_df['impliedVolatility'] *= 100
-
-        options_df.sort_values('strike', inplace=True)
-
-        options_df['moneyness'] = options_df['strike'] / spot_price
-
-        if y_axis_option == 'Strike Price ($)':
-            Y = options_df['strike'].values
-            y_label = 'Strike Price ($)'
-        else:
-            Y = options_df['moneyness'].values
-            y_label = 'Moneyness (Strike / Spot)'
-
-        X = options_df['timeToExpiration'].values
-        Z = options_df['impliedVolatility'].values
-
-        ti = np.linspace(X.min(), X.max(), 50)
-        ki = np.linspace(Y.min(), Y.max(), 50)
-        T, K = np.meshgrid(ti, ki)
-
-        Zi = griddata((X, Y), Z, (T, K), method='linear')
-
-        Zi = np.ma.array(Zi, mask=np.isnan(Zi))
-
-        fig = go.Figure(data=[go.Surface(
-            x=T, y=K, z=Zi,
-            colorscale='Viridis',
-            colorbar_title='Implied Volatility (%)'
-        )])
-
-        fig.update_layout(
-            title=f'Implied Volatility Surface for {ticker_symbol} Options',
-            scene=dict(
-                xaxis_title='Time to Expiration (years)',
-                yaxis_title=y_label,
-                zaxis_title='Implied Volatility (%)'
-            ),
-            autosize=False,
-            width=900,
-            height=800,
-            margin=dict(l=65, r=50, b=65, t=90)
-        )
+for message in fetch_warnings:
+    st.warning(message)
 
-        st.plotly_chart(fig)
+st.plotly_chart(fig)